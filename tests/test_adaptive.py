@@ -20,8 +20,7 @@ class TestAdaptiveSweep(unittest.TestCase):
         self.assertEqual(len(sweep.result.x), 1000)
 
         # check that x is monotonically increasing
-        for increment in np.diff(sweep.result.x):
-            self.assertGreater(increment, 0)
+        self.assertTrue(np.all(np.diff(sweep.result.x) > 0))
 
         # check start is stop reached
         self.assertEqual(sweep.result.x[0], -8)
@@ -33,6 +32,33 @@ class TestAdaptiveSweep(unittest.TestCase):
         for x, y in zip(sweep.result.x, sweep.result.y):
             self.assertEqual(y, x**2)
 
+    def test_run(self):
+        """Check that run measures each step with the given function."""
+
+        sweep = AdaptiveSweep(-8, 5, 100)
+
+        result = sweep.run(lambda x: x**2)
+
+        self.assertEqual(len(result.x), 100)
+        self.assertEqual(result.y, [x**2 for x in result.x])
+
+    def test_prime(self):
+        """Check that a sweep resumes from the points given to prime."""
+
+        previous = AdaptiveSweep(-8, 5, 200)
+        previous.run(lambda x: x**2)
+
+        sweep = AdaptiveSweep(-8, 5, 300)
+        sweep.prime(*previous.result)
+
+        self.assertEqual(sweep.result, previous.result)
+
+        for step in sweep:
+            step.y = step.x**2
+
+        self.assertEqual(len(sweep.result.x), 300)
+        self.assertTrue(set(previous.result.x) <= set(sweep.result.x))
+
     def test_point_density(self):
         """Check that more steps has been allocated to the region of interest."""
 
@@ -44,7 +70,8 @@ class TestAdaptiveSweep(unittest.TestCase):
         for step in sweep:
             step.y = gaussian(step.x, 2, 0.1)
 
-        roi = (np.array(sweep.result.x) >= 0) & (np.array(sweep.result.x) <= 4)
+        x = np.array(sweep.result.x)
+        roi = (x >= 0) & (x <= 4)
 
         density_inside_roi = np.sum(roi) / 4
         density_outside_roi = np.sum(~roi) / (5 + 4)
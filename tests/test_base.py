@@ -18,6 +18,18 @@ class TestSweepResult(unittest.TestCase):
 
         self.assertTrue(np.all(np.array(result) == np.array([x, y])))
 
+    def test_convertion_to_ndarray_dtype(self):
+        """Check the dtype of the ndarray converted from a SweepResult."""
+
+        result = SweepResult([1, 2, 3], [4, 5, 6])
+
+        self.assertEqual(np.array(result).dtype.kind, "i")
+        self.assertEqual(np.array(result, dtype=np.float32).dtype, np.float32)
+
+        result = SweepResult([1.0, 2.0], [None, 3.0])
+
+        self.assertEqual(np.array(result).dtype, object)
+
     def test_equal(self):
         """Check equal operator."""
 
@@ -48,6 +60,14 @@ class TestSweepResult(unittest.TestCase):
 
         self.assertEqual(result1 + result2, expected_result)
 
+    def test_append(self):
+        """Check that a point can be appended in place."""
+
+        result = SweepResult([1, 2], [3, 4])
+        result.append(5, 6)
+
+        self.assertEqual(result, SweepResult([1, 2, 5], [3, 4, 6]))
+
     def test_unpacking(self):
         """Check that a SweepResult can be unpacked."""
 
@@ -3,6 +3,7 @@
 import unittest
 from vsweep import VectorSweep, LinearSweep, LogSweep
 import numpy as np
+from time import sleep
 
 
 class TestVectorSweep(unittest.TestCase):
@@ -35,7 +36,7 @@ class TestVectorSweep(unittest.TestCase):
         sweep = VectorSweep([1, 2, 3], roundtrip=True)
 
         for step in sweep:
-            pass
+            self.assertEqual(step.total, 5)
 
         self.assertEqual(sweep.result.x, [1, 2, 3, 2, 1])
 
@@ -49,6 +50,112 @@ class TestVectorSweep(unittest.TestCase):
 
         self.assertEqual(sweep.result.x, [2, 3, 4, 3, 2, 3, 4, 3, 2, 3, 4, 3, 2])
 
+    def test_element_types(self):
+        """Check that int and mixed int/float x values keep their types."""
+
+        for vector in [[1, 2, 3], [1, 2.5], [-1, 2**63]]:
+            sweep = VectorSweep(vector, roundtrip=True)
+
+            for step in sweep:
+                pass
+
+            self.assertEqual(sweep.result.x, [*vector, *vector[-2:0:-1], vector[0]])
+            self.assertEqual(
+                [type(x) for x in sweep.result.x],
+                [type(x) for x in [*vector, *vector[-2:0:-1], vector[0]]],
+            )
+
+    def test_non_numerical_vector(self):
+        """Check that non-numerical x values are kept untouched."""
+
+        vector = [None, "abc", [1, 2], (3, 4)]
+        sweep = VectorSweep(vector, roundtrip=True)
+
+        for step in sweep:
+            pass
+
+        self.assertEqual(sweep.result.x, [*vector, *vector[-2:0:-1], vector[0]])
+
+    def test_elapsed_time(self):
+        """Check that the elapsed time is measured at first access then fixed."""
+
+        sweep = VectorSweep([1, 2, 3])
+
+        previous = 0
+        for step in sweep:
+            sleep(0.01)
+
+            # includes the time spent in the step before the first access
+            elapsed_time = step.elapsed_time
+            self.assertGreaterEqual(elapsed_time, previous + 0.01)
+
+            sleep(0.01)
+            self.assertEqual(step.elapsed_time, elapsed_time)
+
+            previous = elapsed_time
+
+    def test_batch_update(self):
+        """Check that batch_update is given the x values of each batch."""
+
+        batches = []
+
+        def batch_update(xs):
+            batches.append(list(xs))
+
+        sweep = VectorSweep(
+            [1, 2, 3], npasses=2, batch_update=batch_update, batch_size=4
+        )
+
+        for n, step in enumerate(sweep):
+            self.assertEqual(len(batches), n // 4 + 1)
+
+        self.assertEqual(batches, [[1, 2, 3, 1], [2, 3]])
+
+    def test_invalid_batch_size(self):
+        """Check ValueError is raise if batch_size not > 0."""
+
+        with self.assertRaises(ValueError):
+            VectorSweep([1, 2, 3], batch_size=0)
+
+    def test_run(self):
+        """Check that run measures each step with the given function."""
+
+        sweep = VectorSweep([2, 3, 4], roundtrip=True)
+
+        result = sweep.run(lambda x: x**2)
+
+        self.assertEqual(result.x, [2, 3, 4, 3, 2])
+        self.assertEqual(result.y, [4, 9, 16, 9, 4])
+        self.assertIs(sweep.result, result)
+
+    def test_run_failing(self):
+        """Check that run keeps the points measured before func fails."""
+
+        def func(x):
+            if x == 3:
+                raise RuntimeError()
+            return -x
+
+        sweep = VectorSweep([1, 2, 3, 4])
+
+        with self.assertRaises(RuntimeError):
+            sweep.run(func)
+
+        self.assertEqual(sweep.result.x, [1, 2])
+        self.assertEqual(sweep.result.y, [-1, -2])
+
+    def test_run_update_is_called(self):
+        """Check that run still calls the given update function."""
+
+        calls = []
+
+        sweep = VectorSweep([1, 2, 3], update=lambda step: calls.append(step.x))
+
+        result = sweep.run(lambda x: -x)
+
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertEqual(result.y, [-1, -2, -3])
+
     def test_len(self):
         """Check that the length can be retrieved."""
 
@@ -56,6 +163,24 @@ class TestVectorSweep(unittest.TestCase):
 
         self.assertEqual(len(sweep), 5)
 
+    def test_len_updated(self):
+        """Check that the length follows changes of the sweep parameters."""
+
+        sweep = VectorSweep([1, 2, 3, 4, 5])
+        self.assertEqual(len(sweep), 5)
+
+        sweep.vector = [1, 2]
+        self.assertEqual(len(sweep), 2)
+
+        sweep.npasses = 3
+        self.assertEqual(len(sweep), 6)
+
+        sweep.vector.append(3)
+        self.assertEqual(len(sweep), 9)
+
+        for step in sweep:
+            self.assertEqual(step.total, 9)
+
 
 class TestLinearSweep(unittest.TestCase):
     """Test LinearSweep."""
@@ -96,6 +221,25 @@ class TestLinearSweep(unittest.TestCase):
                 self.assertGreater(x1 - x0, 0)
                 self.assertLessEqual(x1 - x0, 1.001 * max_step_size)
 
+    def test_exact_multiple_max_step_size(self):
+        """Check no extra step is added when max_step_size divides the range."""
+
+        sweep = LinearSweep(0, 2.1, max_step_size=0.3)
+
+        self.assertEqual(len(sweep), 8)
+
+        sweep = LinearSweep(1.0, 1.1, max_step_size=0.01)
+
+        self.assertEqual(len(sweep), 11)
+
+    def test_max_step_size_slightly_exceeded(self):
+        """Check steps stay within max_step_size when the range barely exceeds it."""
+
+        sweep = LinearSweep(0, 1 + 5e-10, max_step_size=0.1)
+
+        self.assertEqual(len(sweep), 12)
+        self.assertTrue(np.all(np.diff(sweep.vector) <= 0.1))
+
     def test_invalid_max_step_size(self):
         """Check ValueError is raise if max_step_size not > 0."""
 
@@ -198,6 +342,24 @@ class TestLogSweep(unittest.TestCase):
                 self.assertGreater(x1 / x0, 1)
                 self.assertLessEqual(x1 / x0, 1.001 * max_step_factor)
 
+    def test_exact_multiple_max_step_factor(self):
+        """Check no extra step is added when max_step_factor divides the range."""
+
+        sweep = LogSweep(1, 125, max_step_factor=5)
+
+        self.assertEqual(len(sweep), 4)
+
+    def test_exact_endpoints(self):
+        """Check that the start and stop x-values are exactly reached."""
+
+        sweep = LogSweep(0.3, 70, nsteps=7)
+
+        for step in sweep:
+            pass
+
+        self.assertEqual(sweep.result.x[0], 0.3)
+        self.assertEqual(sweep.result.x[-1], 70)
+
     def test_invalid_max_step_factor(self):
         """Check ValueError is raise if max_step_factor <= 1."""
 
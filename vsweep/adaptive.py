@@ -5,7 +5,6 @@ Definition of AdaptiveSweep
 
 import numpy as np
 from .base import Sweep, SweepStep, SweepResult
-from adaptive import Learner1D
 
 
 class AdaptiveSweep(Sweep):
@@ -35,28 +34,62 @@ class AdaptiveSweep(Sweep):
             An optionnal function method can be passed to be called at each step.
         """
 
-        super().__init__(update=update)
+        self.update = update
 
         self.start = start
         self.stop = stop
         self.nsteps = nsteps
         self._learner = None
+        self._primed = False
         self._step = None
 
     @property
     def result(self):
         """The result of the sweep."""
 
+        data = self._learner.data
+        x = np.fromiter(data.keys(), dtype=np.float64, count=len(data))
+        y = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+
         # sort data along x
-        data = np.array(sorted(self._learner.data.items(), key=lambda v: v[0]))
+        order = np.argsort(x)
 
-        return SweepResult(*data.T)
+        return SweepResult(x[order], y[order])
+
+    def prime(self, xs, ys):
+        """
+        Feed already measured points to the sweep.
+
+        The next iteration resumes from these points instead of starting over.
+        They are counted in the number of steps.
+
+        Parameters
+        ----------
+        xs : list
+            The x values of the points.
+        ys : list
+            The y values of the points.
+        """
+
+        self._learner = self._new_learner()
+        self._learner.tell_many(np.asarray(xs), np.asarray(ys))
+        self._primed = True
+
+    def _new_learner(self):
+        # imported here as adaptive (and scipy) is slow to import
+        from adaptive import Learner1D
 
-    def __iter__(self):
         def nope(x):
             pass
 
-        self._learner = Learner1D(nope, (self.start, self.stop))
+        return Learner1D(nope, (self.start, self.stop))
+
+    def __iter__(self):
+        # keep the points given to prime
+        if not self._primed:
+            self._learner = self._new_learner()
+
+        self._primed = False
 
         # reset result
         self._result = SweepResult([], [])
@@ -72,7 +105,10 @@ class AdaptiveSweep(Sweep):
         if self._learner.npoints >= self.nsteps:
             raise StopIteration()
 
-        self._step = SweepStep(x=self._learner.ask(1)[0][0])
+        # the point is told right at the next iteration, no need to mark it as
+        # pending which would update the learner losses twice per step
+        x = self._learner.ask(1, tell_pending=False)[0][0]
+        self._step = SweepStep(x=x)
 
         if self.update is not None:
             self.update(self._step.x)
@@ -9,6 +9,7 @@ and `SwepResult.y`.
 
 import numpy as np
 from abc import ABC, abstractmethod
+from time import time
 
 
 class Sweep(ABC):
@@ -18,24 +19,38 @@ class Sweep(ABC):
     A sweep is an iterable object that returns a step at each iteration.
 
     The result of a sweep can be accessed with the `result` property.
+
+    Attributes
+    ----------
+    update : function
+        An optionnal function method can be passed to be called at each step.
     """
 
-    def __init__(self, update=None):
+    @property
+    @abstractmethod
+    def result(self):
+        """The result of the sweep."""
+        raise NotImplementedError()
+
+    def run(self, func):
         """
-        Initializae the sweep.
+        Perform the whole sweep, measuring each step with the given function.
 
         Parameters
         ----------
-        update : function
-            An optionnal function method can be passed to be called at each step.
+        func : function
+            Called with the x value of each step, returns the y value.
+
+        Returns
+        -------
+        SweepResult
+            The result of the sweep.
         """
-        self.update = update
 
-    @property
-    @abstractmethod
-    def result(self):
-        """The result of the sweep."""
-        raise NotImplementedError()
+        for step in self:
+            step.y = func(step.x)
+
+        return self.result
 
     def __iter__(self):
         raise NotImplementedError()
@@ -59,10 +74,23 @@ class SweepStep:
     total : int
         The total number of steps in the sweep.
     elapsed_time : float
-        The elapsed time when since the beginning of the sweep.
+        The elapsed time when since the beginning of the sweep. Unless given
+        explicitly, it is measured when first accessed (e.g. after the
+        measurement of the step) and then kept fixed.
     """
 
-    def __init__(self, x, y=None, step_number=None, total=None, elapsed_time=None):
+    # a step is created at each iteration, avoid a __dict__ per instance
+    __slots__ = ("x", "y", "n", "total", "_elapsed_time", "_start_time")
+
+    def __init__(
+        self,
+        x,
+        y=None,
+        step_number=None,
+        total=None,
+        elapsed_time=None,
+        start_time=None,
+    ):
         """
         Initializae the step.
 
@@ -78,13 +106,36 @@ class SweepStep:
             The total number of steps in the sweep.
         elapsed_time : float
             The elapsed time when since the beginning of the sweep.
+        start_time : float
+            The time at the beginning of the sweep. If provided and
+            elapsed_time is not, the elapsed time is only computed when first
+            accessed.
         """
 
         self.x = x
         self.y = y
         self.n = step_number
         self.total = total
-        self.elapsed_time = elapsed_time
+        self._elapsed_time = elapsed_time
+        self._start_time = start_time
+
+    @property
+    def elapsed_time(self):
+        """
+        The elapsed time when since the beginning of the sweep.
+
+        Unless given explicitly, it is measured when first accessed and then
+        kept fixed.
+        """
+
+        if self._elapsed_time is None and self._start_time is not None:
+            self._elapsed_time = time() - self._start_time
+
+        return self._elapsed_time
+
+    @elapsed_time.setter
+    def elapsed_time(self, elapsed_time):
+        self._elapsed_time = elapsed_time
 
     def __repr__(self):
         def tabulated(info):
@@ -151,16 +202,47 @@ class SweepResult:
             self.x = [x]
             self.y = [y]
 
-    def __array__(self):
-        return np.array([self.x, self.y])
+    def __array__(self, dtype=None, copy=None):
+        # x and y are stored as lists, a new array is always created
+        if copy is False:
+            raise ValueError("a copy is required to convert a SweepResult")
+
+        return np.array([self.x, self.y], dtype=dtype)
+
+    def append(self, x, y):
+        """
+        Append a single point to the result in place.
+
+        Parameters
+        ----------
+        x : float
+            The x value of the point.
+        y : float
+            The y value of the point.
+        """
+
+        self.x.append(x)
+        self.y.append(y)
 
     def __add__(self, other):
-        other = SweepResult(*other)
-        return SweepResult(self.x + other.x, self.y + other.y)
+        if not isinstance(other, SweepResult):
+            other = SweepResult(*other)
+
+        # the concatenated lists are already new, avoid copying them again
+        result = SweepResult.__new__(SweepResult)
+        result.x = self.x + other.x
+        result.y = self.y + other.y
+
+        return result
 
     def __iter__(self):
         return iter([self.x, self.y])
 
     def __eq__(self, other):
-        other = SweepResult(other)
+        if not isinstance(other, SweepResult):
+            other = SweepResult(other)
+
+        if len(self.x) != len(other.x) or len(self.y) != len(other.y):
+            return False
+
         return self.x == other.x and self.y == other.y
@@ -5,7 +5,6 @@ Implemented as iterators -> can be cascaded
 from .base import Sweep, SweepStep, SweepResult
 
 import numpy as np
-from itertools import chain, repeat
 from time import time
 from math import ceil
 
@@ -15,6 +14,20 @@ from math import ceil
 #      check multidimensionnal ?
 
 
+def _nsteps(nintervals, error=0):
+    """
+    Number of steps needed to split a range into at least `nintervals` intervals.
+
+    A tolerance of a few times the rounding `error` of `nintervals` (plus a few
+    ulps) prevents a floating-point error from adding an extra step when the
+    range is an exact multiple of the step.
+    """
+
+    tolerance = 4 * (error + np.spacing(nintervals))
+
+    return int(ceil(nintervals - tolerance)) + 1
+
+
 class VectorSweep(Sweep):
     """
     Sweep iterating over a vector of x values.
@@ -24,7 +37,15 @@ class VectorSweep(Sweep):
     The result of a sweep can be accessed with the `result` property.
     """
 
-    def __init__(self, vector, roundtrip=False, npasses=1, update=None):
+    def __init__(
+        self,
+        vector,
+        roundtrip=False,
+        npasses=1,
+        update=None,
+        batch_update=None,
+        batch_size=64,
+    ):
         """
         Initializae the sweep.
 
@@ -38,9 +59,19 @@ class VectorSweep(Sweep):
             The number of times the vector will be repeated.
         update : function
             An optionnal function method can be passed to be called at each step.
+        batch_update : function
+            An optionnal function called with the list of the next
+            batch_size x values before the first step of each batch.
+        batch_size : int
+            The number of x values given at once to batch_update.
         """
 
-        super().__init__(update=update)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+
+        self.update = update
+        self.batch_update = batch_update
+        self.batch_size = batch_size
 
         self.vector = list(vector)
         self.roundtrip = roundtrip
@@ -48,7 +79,10 @@ class VectorSweep(Sweep):
 
         self._result = None
         self._step = None
-        self._iterator = None
+        self._values = None
+        self._schedule = None
+        self._i = None
+        self._total = None
         self._start_time = None
 
     @property
@@ -56,6 +90,21 @@ class VectorSweep(Sweep):
         """The result of the sweep."""
         return self._result
 
+    def run(self, func):
+        # without callbacks, there is no need to go through the steps
+        if self.update or self.batch_update:
+            return super().run(func)
+
+        iter(self)
+
+        # filled as it goes to keep the measured points if func fails
+        for i in self._schedule:
+            x = self._values[i]
+            self._result.append(x, func(x))
+            self._i += 1
+
+        return self._result
+
     def __iter__(self):
         self._start_time = time()
 
@@ -63,40 +112,51 @@ class VectorSweep(Sweep):
         self._result = SweepResult([], [])
         self._step = None
 
+        # the x values are kept as given, only their indices are scheduled
+        self._values = list(self.vector)
+        indices = np.arange(len(self._values))
+
         # create roundtrip and avoid repetitions of the last elements
         if self.roundtrip:
-            # prepare passes
-            vector = self.vector
-
             # create roundtrip and discard last element [1,2,3,4,5,4,3,2]
-            vector = list(chain(vector[::1], vector[-2:0:-1]))
-
-            # repeat the roundtrip for each pass
-            vector = chain(*repeat(list(vector), self.npasses))
-
-            # put back the last element
-            vector = list(chain(vector, self.vector[:1]))
+            indices = np.concatenate([indices, indices[-2:0:-1]])
 
-            self._iterator = enumerate(vector)
+            # repeat the roundtrip for each pass and put back the last element
+            indices = np.concatenate([np.tile(indices, self.npasses), indices[:1]])
 
         else:
             # repeat the vector for each pass
-            self._iterator = enumerate(chain(*repeat(self.vector, self.npasses)))
+            indices = np.tile(indices, self.npasses)
+
+        # indices of the x values of all the steps, indexed by the step number
+        self._schedule = indices
+        self._i = 0
+        self._total = len(self._schedule)
 
         return self
 
     def __next__(self):
         # save data of the previous step
         if self._step is not None:
-            self._result = self._result + [self._step.x, self._step.y]
+            self._result.append(self._step.x, self._step.y)
+
+        if self._i >= len(self._schedule):
+            self._step = None
+            raise StopIteration()
 
-        # create next step
-        elapsed_time = time() - self._start_time
-        n, x = next(self._iterator)
+        # create next step, the elapsed time is computed only if accessed
+        n = self._i
+        x = self._values[self._schedule[n]]
+        self._i += 1
         self._step = SweepStep(
-            x=x, step_number=n, total=len(self), elapsed_time=elapsed_time
+            x=x, step_number=n, total=self._total, start_time=self._start_time
         )
 
+        # give the x values of the next batch at once
+        if self.batch_update and n % self.batch_size == 0:
+            batch = self._schedule[n : n + self.batch_size]
+            self.batch_update([self._values[i] for i in batch])
+
         # call update
         if self.update:
             self.update(self._step)
@@ -131,6 +191,8 @@ class LinearSweep(VectorSweep):
         roundtrip=False,
         npasses=1,
         update=None,
+        batch_update=None,
+        batch_size=64,
     ):
         """
         Initializae the sweep.
@@ -155,6 +217,11 @@ class LinearSweep(VectorSweep):
         update : function
             An optionnal function method can be passed to be called at each
             step.
+        batch_update : function
+            An optionnal function called with the list of the next
+            batch_size x values before the first step of each batch.
+        batch_size : int
+            The number of x values given at once to batch_update.
         """
 
         # save previous step result
@@ -162,12 +229,19 @@ class LinearSweep(VectorSweep):
             if max_step_size <= 0:
                 raise ValueError("max_step_size must be > 0")
 
-            nsteps = int(ceil(abs((stop - start) / max_step_size))) + 1
+            # rounding of start and stop dominates the error of stop - start
+            error = np.spacing(max(abs(start), abs(stop))) / max_step_size
+            nsteps = _nsteps(abs((stop - start) / max_step_size), error)
 
         vector = np.linspace(start, stop, nsteps)
 
         super().__init__(
-            vector=vector, roundtrip=roundtrip, npasses=npasses, update=update
+            vector=vector,
+            roundtrip=roundtrip,
+            npasses=npasses,
+            update=update,
+            batch_update=batch_update,
+            batch_size=batch_size,
         )
 
 
@@ -189,6 +263,8 @@ class LogSweep(VectorSweep):
         roundtrip=False,
         npasses=1,
         update=None,
+        batch_update=None,
+        batch_size=64,
     ):
         """
         Initializae the sweep.
@@ -211,6 +287,11 @@ class LogSweep(VectorSweep):
             The number of times the vector will be repeated.
         update : function
             An optionnal function method can be passed to be called at each step.
+        batch_update : function
+            An optionnal function called with the list of the next
+            batch_size x values before the first step of each batch.
+        batch_size : int
+            The number of x values given at once to batch_update.
         """
 
         # save previous step result
@@ -218,10 +299,17 @@ class LogSweep(VectorSweep):
             if max_step_factor <= 1:
                 raise ValueError("max_step_factor must be > 1")
 
-            nsteps = ceil(abs(np.log(stop / start)) / np.log(max_step_factor)) + 1
+            log_ratio = abs(np.log(stop / start))
+            nsteps = _nsteps(log_ratio / np.log(max_step_factor))
 
-        vector = np.logspace(np.log10(start), np.log10(stop), nsteps)
+        # geomspace keeps the start and stop values exact
+        vector = np.geomspace(start, stop, nsteps)
 
         super().__init__(
-            vector=vector, roundtrip=roundtrip, npasses=npasses, update=update
+            vector=vector,
+            roundtrip=roundtrip,
+            npasses=npasses,
+            update=update,
+            batch_update=batch_update,
+            batch_size=batch_size,
         )